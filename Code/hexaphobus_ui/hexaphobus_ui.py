@@ -51,10 +51,12 @@
 
 # Computing
 import math
+from functools import partial
 
 # System
-import os
 import sys
+from enum import IntEnum
+from pathlib import Path
 
 # Timing and communication
 import serial
@@ -62,12 +64,14 @@ from threading import Timer
 import time
 
 # User interface
-from PyQt5.QtCore import Qt, QTimer, QPoint, QThread
-from PyQt5.QtGui import (QColor, QIcon, QPainter, QPalette, QKeySequence,
-                         QDoubleValidator, QPixmap)
-from PyQt5.QtWidgets import (QApplication, QGridLayout, QHBoxLayout, QLabel,
-                             QLineEdit, QPushButton, QVBoxLayout, QWidget,
-                             QShortcut, QFrame, QSizePolicy)
+from PyQt5.QtCore import (Qt, QTimer, QLine, QPoint, QThread,
+                          pyqtSignal)
+from PyQt5.QtGui import (QColor, QIcon, QPainter, QPen,
+                         QKeySequence, QPixmap)
+from PyQt5.QtWidgets import (QApplication, QGridLayout, QLabel, QLineEdit,
+                             QPushButton, QVBoxLayout, QWidget,
+                             QShortcut, QFrame, QSizePolicy, QTableWidget,
+                             QTableWidgetItem, QAbstractItemView)
 
 #********************************************#
 
@@ -79,18 +83,16 @@ SERVO_TABLE = list()
 
 ## Number of servomotors
 SV_NBR = len(Servos_Num)
-## Servomotor window width
+## Servomotor table column width
 SV_W = 100
-## Servomotor window height
+## Servomotor table row height
 SV_H = 30
-## Arrow button width
-ARROW_W = 60
-## Arrow button height
-ARROW_H = 30
-## Button width
-BUTTON_W = 120
-## Button height
-BUTTON_H = 60
+## Servomotor table headers
+SV_HEADERS = ["Servo", "Value"]
+## Arrow button style class (sizes set in the style sheet)
+ARROW_CLASS = "arrow"
+## Button style class (sizes set in the style sheet)
+BUTTON_CLASS = "cmd"
 ## Information window width
 INFO_W = 190
 ## Information window height
@@ -111,6 +113,8 @@ UI_H = 600
 UI_MIN_W = 480
 ## User interface height (minimum)
 UI_MIN_H = 360
+## Repaint throttling delay (in ms, about 60 Hz)
+REPAINT_DELAY = 16
 
 ## Flag (command number to define next position to reach)
 NB_COMMAND = 0
@@ -141,6 +145,8 @@ STR_B = "BACKWARD"
 STR_L = "LEFT"
 ## Movement string (right)
 STR_R = "RIGHT"
+## Movement steps (x; y), indexed by 'Direction' value
+DIRECTIONS = ((0, -1), (0, 1), (1, 0), (-1, 0))
 ## Serial communication string
 BUTTON_SERIAL = "Start Serial"
 ## Initialization button string
@@ -148,12 +154,11 @@ BUTTON_INIT = "POS INIT"
 ## Program button string
 BUTTON_PRG1 = "PRG1"
 ## Second level parent folder
-SCRIPT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
-                                          "..", ".."))
-## Separator (OS dependent)
-SEP = os.path.sep
-## User interface logo directory
-LOGO = 'img' + SEP + 'hexaphobus_logo.png'
+SCRIPT_DIR = Path(__file__).resolve().parents[2]
+## User interface logo path
+LOGO_PATH = str(SCRIPT_DIR / "img" / "hexaphobus_logo.png")
+## User interface style sheet path (dark theme and button sizes)
+STYLE_PATH = Path(__file__).resolve().parent / "dark.qss"
 
 #********************************************#
 
@@ -173,9 +178,40 @@ def byteToString(encoded_string):
     string = encoded_string.decode().strip()
     return string
 
+def roundSqrt(value):
+    """
+    Returns the square root of a non-negative integer, rounded to the
+    nearest integer, without leaving integer arithmetic.
+    """
+    root = math.isqrt(value)
+    if value - root * root > root:
+        root += 1
+    return root
+
+def stepWithin(position, step, limit):
+    """
+    Returns the position moved by a step, without crossing 0 or the
+    limit (a position already out of bounds never moves further out).
+    """
+    if step > 0:
+        return max(position, min(position + step, limit))
+    if step < 0:
+        return min(position, max(position + step, 0))
+    return position
+
 # --------------------------------------------
 
 
+class Direction(IntEnum):
+    """
+    The 'Direction' class enumerates the robot movements. Member names
+    match the movement strings sent to the serial port.
+    """
+    FORWARD = 0
+    BACKWARD = 1
+    RIGHT = 2
+    LEFT = 3
+
 class RepeatedTimer(object):
     """
     The 'RepeatedTimer' class allows the user to time some operations
@@ -281,25 +317,38 @@ class RobotTracking(QWidget):
     The 'RobotTracking' class is a QWidget subclass that allows the user
      to follow the robot position from an initialized origin point.
     """
+    ## Tracking label template (coordinates and distance from origin)
+    _FMT = "Coordinates (x; y): ({}; {})\nDistance from origin: {}"
+    ## Robot coordinates (x; y) received from telemetry (any thread)
+    coordsReceived = pyqtSignal(int, int)
 
-    def __init__(self):
+    def __init__(self, parent=None):
         """
         The 'RobotTracking' class constructor initializes, notably, the
         widget to follow the robot's position. It builds upon the
         constructor of its parent class, 'QWidget'.
         """
-        super().__init__()
+        super().__init__(parent)
         self.setStyleSheet("border:1px solid rgb(0, 0, 0)")
         self._distance_origin = 0
+        self._distance_origin_sq = 0
         self._robot_x_pos = 200
         self._robot_y_pos = 200
         self._target_x_pos = 250
         self._target_y_pos = 250
-        self._vel = 60  # pixels per second
         self._speed = 10
-
-        self.timer = QTimer(self)
-        self.timer.start(round(1000 / self._vel))
+        self._pending = False
+        self._pending_dx = 0
+        self._pending_dy = 0
+        self._last_rx = None
+        self._last_ry = None
+        self._last_txt = None
+        self._pen = QPen(QColor(0, 0, 0))
+        self._line = QLine(self._robot_x_pos, self._robot_y_pos,
+                           self._target_x_pos, self._target_y_pos)
+        self._pix_robot = QPixmap(LOGO_PATH).scaledToHeight(40)
+
+        self.coordsReceived.connect(self.receivePosition, Qt.QueuedConnection)
         self.initTracking()
 
     def initTracking(self):
@@ -311,72 +360,128 @@ class RobotTracking(QWidget):
         self.label = QLabel(self)
         self.label.resize(TRACK_W, TRACK_H)
         self.label.setStyleSheet("color : rgb(0,0,0)")
-        self.show()
 
     def changePosition(self, direction):
         """
-        Updates the target's distance and position according to
-        geometry.
-        """
-        UI_Graph_W = self.geometry().width()
-        UI_Graph_H = self.geometry().height()
-
-        if direction == STR_F and self._robot_y_pos > 0:
-            self._robot_y_pos -= self._speed
-            ENCODED_VAR = stringToByte('FORWARD')
-        elif direction == STR_B and self._robot_y_pos < UI_Graph_H:
-            self._robot_y_pos += self._speed
-            ENCODED_VAR = stringToByte('BACKWARD')
-        elif direction == STR_R and self._robot_x_pos < UI_Graph_W:
-            self._robot_x_pos += self._speed
-            ENCODED_VAR = stringToByte('RIGHT')
-        elif direction == STR_L and self._robot_x_pos > 0:
-            self._robot_x_pos -= self._speed
-            ENCODED_VAR = stringToByte('LEFT')
-
-        self.moveRobot(self._robot_x_pos, self._robot_y_pos)
-        self.update()
+        Accumulates a step in the movement 'direction' (a 'Direction'
+        member). Steps received before the next repaint tick are applied
+        together.
+        """
+        step_x, step_y = DIRECTIONS[direction]
+        self._pending_dx += step_x * self._speed
+        self._pending_dy += step_y * self._speed
+        self._scheduleRepaint()
+
+    def receivePosition(self, robotX, robotY):
+        """
+        Event that moves the robot to the coordinates received from
+        telemetry. Steps accumulated since the last repaint are dropped,
+        the reported position already accounts for them.
+        """
+        self._pending_dx = 0
+        self._pending_dy = 0
+        self.setPosition(robotX, robotY)
+
+    def setPosition(self, robotX, robotY):
+        """
+        Event that moves the robot to the received coordinates.
+        """
+        self._robot_x_pos = robotX
+        self._robot_y_pos = robotY
+        self._line.setP1(QPoint(robotX, robotY))
+        self.moveRobot(robotX, robotY)
 
     def moveRobot(self, robotX, robotY):
         """
         Event that updates the target's distance and position label
         relative to the origin according to the target's movements.
         """
-        self._distance_origin = round(
-            ((robotY - self._target_y_pos)**2
-             + (robotX - self._target_x_pos)**2)**0.5
-        )
+        if (robotX, robotY) == (self._last_rx, self._last_ry):
+            return
+        self._last_rx = robotX
+        self._last_ry = robotY
 
-        self.label.setText(
-            "Coordinates (x; y): ({}; {})\nDistance from origin: {}"
-            .format(robotX, robotY, self._distance_origin)
-        )
+        delta_x = robotX - self._target_x_pos
+        delta_y = robotY - self._target_y_pos
+        self._distance_origin_sq = delta_x * delta_x + delta_y * delta_y
+        self._distance_origin = roundSqrt(self._distance_origin_sq)
+
+        self._scheduleRepaint()
+
+    def within(self, distance):
+        """
+        Returns whether the robot is within 'distance' pixels of the
+        origin (compares squared distances).
+        """
+        return self._distance_origin_sq <= distance * distance
 
+    def _scheduleRepaint(self):
+        """
+        Schedules a single repaint, coalescing successive requests
+        received before the throttling delay expires.
+        """
+        if not self._pending:
+            self._pending = True
+            QTimer.singleShot(REPAINT_DELAY, Qt.CoarseTimer, self._flush)
+
+    def _applySteps(self):
+        """
+        Applies the accumulated steps to the robot position, according
+        to geometry.
+        """
+        if self._pending_dx or self._pending_dy:
+            UI_Graph_W = self.geometry().width()
+            UI_Graph_H = self.geometry().height()
+            self.setPosition(
+                stepWithin(self._robot_x_pos, self._pending_dx, UI_Graph_W),
+                stepWithin(self._robot_y_pos, self._pending_dy, UI_Graph_H)
+            )
+            self._pending_dx = 0
+            self._pending_dy = 0
+
+    def _flush(self):
+        """
+        Refreshes the tracking label (only if its text changed) and
+        repaints the widget once the throttling delay has expired.
+        Accumulated steps are applied first.
+        """
+        self._applySteps()
+
+        self._pending = False
+        # The label is only redrawn here: every state mutator
+        # (moveRobot, initPosition) must keep _distance_origin current.
+        text = self._FMT.format(self._robot_x_pos, self._robot_y_pos,
+                                self._distance_origin)
+        if text != self._last_txt:
+            self.label.setText(text)
+            self._last_txt = text
         self.update()
 
     def initPosition(self):
         """
         Event that updates the origin point according to reset command.
+        Steps accumulated since the last repaint are applied first.
         """
+        self._applySteps()
         self._target_x_pos = self._robot_x_pos
         self._target_y_pos = self._robot_y_pos
-        self.update()
+        self._line.setP2(self._line.p1())
+        self._distance_origin_sq = 0
+        self._distance_origin = 0
+        self._last_rx = None
+        self._last_ry = None
+        self._scheduleRepaint()
 
     def paintEvent(self, event):
         """
         Event that draws a line between the target's position and its
         origin.
         """
-        robot = QPixmap(SCRIPT_DIR + SEP + LOGO)
-        pix_robot = robot.scaledToHeight(40)
-
-        q = QPainter()
-        q.begin(self)
-        q.setPen(QColor(0, 0, 0))
+        q = QPainter(self)
+        q.setPen(self._pen)
         q.drawPixmap(QPoint(self._robot_x_pos-20, self._robot_y_pos-20),
-                     pix_robot)
-        q.drawLine(self._robot_x_pos, self._robot_y_pos,
-                   self._target_x_pos, self._target_y_pos)
+                     self._pix_robot)
+        q.drawLine(self._line)
         moving_command = byteToString(ENCODED_VAR)
         
         '''
@@ -409,6 +514,8 @@ class RobotTracking(QWidget):
                    self._robot_x_pos-32, self._robot_y_pos-13+move_leg)
         '''
 
+        q.end()
+
 class MainWindow(QWidget):
     """
     The 'MainWindow' class is a QWidget subclass that allows the user
@@ -419,33 +526,19 @@ class MainWindow(QWidget):
         """
         The 'MainWindow' class constructor initializes the GUI interface
         and all its components (layout boxes, push buttons, shortcuts,
-        lines, edits, frames, validators). It builds upon the
+        lines, edits, frames, tables). It builds upon the
         constructor of its parent class, 'QWidget'.
         """
         super().__init__()
 
         # Servos
-        self._servo_edits = list()
-        self._servo_labels = list()
+        self.servo_table = QTableWidget(SV_NBR, len(SV_HEADERS))
         global SERVO_TABLE
 
         # Layouts
-        self.global_layout = QVBoxLayout()
-
-        self.top_layout = QHBoxLayout()
-        self.bottom_layout = QHBoxLayout()
-
-        self.servo_layout_1 = QVBoxLayout()
-        self.servo_layout_2 = QVBoxLayout()
-        self.servo_layout_3 = QVBoxLayout()
-        self.servo_layout_4 = QVBoxLayout()
+        self.global_layout = QGridLayout()
         self.tracking_layout = QVBoxLayout()
 
-
-        self.info_layout = QVBoxLayout()
-        self.prog_layout = QVBoxLayout()
-        self.move_layout = QGridLayout()
-
         # Buttons
         self.button_up = QPushButton(BUTTON_UP)
         self.button_down = QPushButton(BUTTON_DOWN)
@@ -456,6 +549,13 @@ class MainWindow(QWidget):
         self.button_init = QPushButton(BUTTON_INIT)
         self.button_prog = QPushButton(BUTTON_PRG1)
 
+        for button in (self.button_up, self.button_down,
+                       self.button_left, self.button_right):
+            button.setProperty("class", ARROW_CLASS)
+        for button in (self.button_serial_start, self.button_init,
+                       self.button_prog):
+            button.setProperty("class", BUTTON_CLASS)
+
         #Shortcut
         self.shortcut_up = QShortcut(QKeySequence("alt+up"), self)
         self.shortcut_down = QShortcut(QKeySequence("alt+down"), self)
@@ -471,7 +571,6 @@ class MainWindow(QWidget):
         self.GraphFrame = QFrame()
         self.GraphFrame.setFrameShape(QFrame.Box)
         self.GraphFrame.setStyleSheet("background: rgb(180,180,180)")
-        self.onlyFloat = QDoubleValidator()
 
         self.serialCheck = SerialChecker()
         self.serialCheck.SerialRun()
@@ -479,17 +578,11 @@ class MainWindow(QWidget):
 
         self.initUI()
 
-    def getServoEdits(self):
-        """
-        Return the servomotor commands.
-        """
-        return self._servo_edits
-
-    def getServoLabels(self):
+    def getServoTable(self):
         """
-        Return the servomotor labels.
+        Return the servomotor table (labels and commands).
         """
-        return self._servo_labels
+        return self.servo_table
 
     def initUI(self):
         """
@@ -500,55 +593,41 @@ class MainWindow(QWidget):
             -the buttons;
             -the connections;
             -the robot information;
-            -the dependencies (nested layouts);
             -the widgets.
         """
         self.setGeometry(UI_X, UI_Y, UI_W, UI_H)
         self.setWindowTitle(WINDOW_NAME)
 
-        self.tracking = RobotTracking()
+        self.tracking = RobotTracking(parent=self.GraphFrame)
         self.tracking.setSizePolicy(
             QSizePolicy.Expanding, QSizePolicy.Expanding
         )
         self.addServos()
-        self.setSizeButtons()
         self.setConnections()
         self.setInfo()
-        self.setLayoutDependencies()
         self.addWidgets()
-        self.setLayout(self.global_layout)
         self.setInfoValues("100", "200")
+        self.setLayout(self.global_layout)
 
         self.show()
 
     def addServos(self):
         """
-        Add servomotor edits and labels used to monitor their state.
-        """
-        for index in range(SV_NBR):
-            self._servo_edits.append(QLineEdit())
-            self._servo_edits[index].setFixedSize(SV_W, SV_H)
-            self._servo_edits[index].setReadOnly(True)
-            self._servo_edits[index].setStyleSheet("color : rgb(0,0,0)")
-            self._servo_edits[index].setValidator(self.onlyFloat)
-
-            self._servo_labels.append(QLabel())
-            self._servo_labels[index].setAlignment(Qt.AlignCenter)
-            self._servo_labels[index].setText("Servo{:02d}"
-                                              .format(Servos_Num[index]))
-
-    def setSizeButtons(self):
-        """
-        Fix button size according to type.
+        Fill the servomotor table used to monitor their state (one row
+        per servomotor).
         """
-        self.button_up.setFixedSize(ARROW_W, ARROW_H)
-        self.button_down.setFixedSize(ARROW_W, ARROW_H)
-        self.button_left.setFixedSize(ARROW_W, ARROW_H)
-        self.button_right.setFixedSize(ARROW_W, ARROW_H)
+        self.servo_table.setHorizontalHeaderLabels(SV_HEADERS)
+        self.servo_table.verticalHeader().setVisible(False)
+        self.servo_table.horizontalHeader().setDefaultSectionSize(SV_W)
+        self.servo_table.verticalHeader().setDefaultSectionSize(SV_H)
+        self.servo_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.servo_table.setStyleSheet("color : rgb(0,0,0)")
 
-        self.button_serial_start.setFixedSize(BUTTON_W, BUTTON_H)
-        self.button_init.setFixedSize(BUTTON_W, BUTTON_H)
-        self.button_prog.setFixedSize(BUTTON_W, BUTTON_H)
+        for index in range(SV_NBR):
+            label = QTableWidgetItem("Servo{:02d}".format(Servos_Num[index]))
+            label.setTextAlignment(Qt.AlignCenter)
+            self.servo_table.setItem(index, 0, label)
+            self.servo_table.setItem(index, 1, QTableWidgetItem())
 
     def setConnections(self):
         """
@@ -560,52 +639,52 @@ class MainWindow(QWidget):
         self.button_prog.clicked.connect(self.printVariable)
         self.button_init.clicked.connect(self.tracking.initPosition)
         self.button_up.clicked.connect(
-            lambda: self.tracking.changePosition(STR_F)
+            partial(self.tracking.changePosition, Direction.FORWARD)
         )
         self.shortcut_up.activated.connect(
-            lambda: self.tracking.changePosition(STR_F)
+            partial(self.tracking.changePosition, Direction.FORWARD)
         )
         self.button_up.clicked.connect(
-            lambda: self.serialCheck.serialSend(STR_F)
+            partial(self.serialCheck.serialSend, STR_F)
         )
         self.shortcut_up.activated.connect(
-            lambda: self.serialCheck.serialSend(STR_F)
+            partial(self.serialCheck.serialSend, STR_F)
         )
         self.button_down.clicked.connect(
-            lambda: self.tracking.changePosition(STR_B)
+            partial(self.tracking.changePosition, Direction.BACKWARD)
         )
         self.shortcut_down.activated.connect(
-            lambda: self.tracking.changePosition(STR_B)
+            partial(self.tracking.changePosition, Direction.BACKWARD)
         )
         self.button_down.clicked.connect(
-            lambda: self.serialCheck.serialSend(STR_B)
+            partial(self.serialCheck.serialSend, STR_B)
         )
         self.shortcut_down.activated.connect(
-            lambda: self.serialCheck.serialSend(STR_B)
+            partial(self.serialCheck.serialSend, STR_B)
         )
         self.button_left.clicked.connect(
-            lambda: self.tracking.changePosition(STR_L)
+            partial(self.tracking.changePosition, Direction.LEFT)
         )
         self.shortcut_left.activated.connect(
-            lambda: self.tracking.changePosition(STR_L)
+            partial(self.tracking.changePosition, Direction.LEFT)
         )
         self.button_left.clicked.connect(
-            lambda: self.serialCheck.serialSend(STR_L)
+            partial(self.serialCheck.serialSend, STR_L)
         )
         self.shortcut_left.activated.connect(
-            lambda: self.serialCheck.serialSend(STR_L)
+            partial(self.serialCheck.serialSend, STR_L)
         )
         self.button_right.clicked.connect(
-            lambda: self.tracking.changePosition(STR_R)
+            partial(self.tracking.changePosition, Direction.RIGHT)
         )
         self.shortcut_right.activated.connect(
-            lambda: self.tracking.changePosition(STR_R)
+            partial(self.tracking.changePosition, Direction.RIGHT)
         )
         self.button_right.clicked.connect(
-            lambda: self.serialCheck.serialSend(STR_R)
+            partial(self.serialCheck.serialSend, STR_R)
         )
         self.shortcut_right.activated.connect(
-            lambda: self.serialCheck.serialSend(STR_R)
+            partial(self.serialCheck.serialSend, STR_R)
         )
 
     def cleanUp(self):
@@ -647,8 +726,8 @@ class MainWindow(QWidget):
         Set the servomotor edit text.
         """
         self.serialCheck.serialReceive()
-        for (angle, servo) in zip(SERVO_TABLE, self._servo_edits):
-            servo.setText(angle)
+        for (index, angle) in enumerate(SERVO_TABLE):
+            self.servo_table.item(index, 1).setText(angle)
             time.sleep(0.05)
 
     def setInfoValues(self, Speed, Energy):
@@ -659,76 +738,32 @@ class MainWindow(QWidget):
         self.speed_edit.setText(Speed)
         self.energy_edit.setText(Energy)
 
-    def setLayoutDependencies(self):
-        """
-        Add inner layouts to outer layouts (creates a parent-child
-        structure with nested layouts).
-        """
-        self.global_layout.addLayout(self.top_layout)
-        self.global_layout.addLayout(self.bottom_layout)
-
-        self.top_layout.addLayout(self.servo_layout_1)
-        self.top_layout.addLayout(self.servo_layout_2)
-        self.top_layout.addWidget(self.GraphFrame)
-        self.top_layout.addLayout(self.servo_layout_3)
-        self.top_layout.addLayout(self.servo_layout_4)
-
-        self.bottom_layout.addLayout(self.info_layout)
-        self.bottom_layout.addLayout(self.prog_layout)
-        self.bottom_layout.addLayout(self.move_layout)
-        self.bottom_layout.addWidget(self.button_serial_start)
-
-    def strechServoLayouts(self):
-        """
-        Add padding between widgets and/or layout walls in the
-        servomotor layouts.
-        """
-        self.servo_layout_1.addStretch(1)
-        self.servo_layout_2.addStretch(1)
-        self.servo_layout_3.addStretch(1)
-        self.servo_layout_4.addStretch(1)
-
     def addWidgets(self):
         """
-        Add widgets to various layouts.
-        """
-        self.strechServoLayouts()
-
-        for counter, (edit, label) in \
-            enumerate(zip(self._servo_edits, self._servo_labels)):
-
-            if counter < math.ceil(SV_NBR/4):
-                self.servo_layout_1.addWidget(label)
-                self.servo_layout_1.addWidget(edit)
-                self.servo_layout_1.addStretch(1)
-            elif counter < math.ceil(SV_NBR/2):
-                self.servo_layout_2.addWidget(label)
-                self.servo_layout_2.addWidget(edit)
-                self.servo_layout_2.addStretch(1)
-            elif counter < math.ceil(SV_NBR*3/4):
-                self.servo_layout_3.addWidget(label)
-                self.servo_layout_3.addWidget(edit)
-                self.servo_layout_3.addStretch(1)
-            elif counter < SV_NBR:
-                self.servo_layout_4.addWidget(label)
-                self.servo_layout_4.addWidget(edit)
-                self.servo_layout_4.addStretch(1)
-
+        Add widgets to the global grid layout (monitoring on the first
+        row, information and controls on the following ones).
+        """
         self.tracking_layout.addWidget(self.tracking)
         self.GraphFrame.setLayout(self.tracking_layout)
 
-        self.info_layout.addWidget(self.speed_label)
-        self.info_layout.addWidget(self.speed_edit)
-        self.info_layout.addWidget(self.energy_label)
-        self.info_layout.addWidget(self.energy_edit)
+        self.global_layout.addWidget(self.servo_table, 0, 0, 1, 2)
+        self.global_layout.addWidget(self.GraphFrame, 0, 2, 1, 4)
+        self.global_layout.setRowStretch(0, 1)
+
+        self.global_layout.addWidget(self.speed_label, 1, 0)
+        self.global_layout.addWidget(self.speed_edit, 2, 0)
+        self.global_layout.addWidget(self.energy_label, 3, 0)
+        self.global_layout.addWidget(self.energy_edit, 4, 0)
 
-        self.prog_layout.addWidget(self.button_init)
-        self.prog_layout.addWidget(self.button_prog)
+        self.global_layout.addWidget(self.button_init, 1, 1, 2, 1)
+        self.global_layout.addWidget(self.button_prog, 3, 1, 2, 1)
 
-        self.move_layout.addWidget(self.button_up, 0, 1, 1, 1)
-        self.move_layout.addWidget(self.button_down, 1, 1)
-        self.move_layout.addWidget(self.button_left, 1, 0)
-        self.move_layout.addWidget(self.button_right, 1, 2)
+        self.global_layout.addWidget(self.button_up, 2, 3)
+        self.global_layout.addWidget(self.button_down, 3, 3)
+        self.global_layout.addWidget(self.button_left, 3, 2)
+        self.global_layout.addWidget(self.button_right, 3, 4)
+
+        self.global_layout.addWidget(self.button_serial_start, 1, 5, 4, 1)
 
 # --------------------------------------------
 
@@ -736,28 +771,12 @@ class MainWindow(QWidget):
 if __name__ == '__main__':
     ## Create a Qt application and window to display.
     app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon(SCRIPT_DIR + SEP + LOGO))
+    app.setWindowIcon(QIcon(LOGO_PATH))
+    app.setStyleSheet(STYLE_PATH.read_text())
 
     ## Create the widget window.
     window = MainWindow()
     app.aboutToQuit.connect(window.cleanUp)
 
-    ## Style setup
-    palette = window.palette()
-    palette.setColor(QPalette.Window, QColor(53, 53, 53))
-    palette.setColor(QPalette.WindowText, Qt.white)
-    palette.setColor(QPalette.Base, QColor(25, 25, 25))
-    palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-    palette.setColor(QPalette.ToolTipBase, Qt.white)
-    palette.setColor(QPalette.ToolTipText, Qt.white)
-    palette.setColor(QPalette.Text, Qt.white)
-    palette.setColor(QPalette.Button, QColor(53, 53, 53))
-    palette.setColor(QPalette.ButtonText, Qt.black)
-    palette.setColor(QPalette.BrightText, Qt.red)
-    palette.setColor(QPalette.Link, QColor(42, 130, 218))
-    palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-    palette.setColor(QPalette.HighlightedText, Qt.black)
-    window.setPalette(palette)
-
     # Kill display
     sys.exit(app.exec_())
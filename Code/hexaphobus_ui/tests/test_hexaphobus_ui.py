@@ -51,5 +51,39 @@ class TestHexaphobusUI(unittest.TestCase):
         string = hexaphobus_ui.byteToString(self._encoded_data)
         self.assertEqual(len(string), 4)
 
+    def test_roundSqrt(self):
+        for value in range(10000):
+            self.assertEqual(hexaphobus_ui.roundSqrt(value),
+                             round(value**0.5))
+
+    def test_stepWithin(self):
+        self.assertEqual(hexaphobus_ui.stepWithin(200, 30, 400), 230)
+        self.assertEqual(hexaphobus_ui.stepWithin(395, 30, 400), 400)
+        self.assertEqual(hexaphobus_ui.stepWithin(5, -30, 400), 0)
+        self.assertEqual(hexaphobus_ui.stepWithin(410, 10, 400), 410)
+        self.assertEqual(hexaphobus_ui.stepWithin(410, -10, 400), 400)
+
+    def test_receivePosition(self):
+        class Tracking(object):
+            _pending_dx = 10
+            _pending_dy = -20
+            positions = list()
+
+            def setPosition(self, robotX, robotY):
+                self.positions.append((robotX, robotY))
+
+        tracking = Tracking()
+        hexaphobus_ui.RobotTracking.receivePosition(tracking, 120, 80)
+        hexaphobus_ui.RobotTracking._applySteps(tracking)
+        self.assertEqual(tracking.positions, [(120, 80)])
+
+    def test_directionNames(self):
+        commands = [hexaphobus_ui.STR_F, hexaphobus_ui.STR_B,
+                    hexaphobus_ui.STR_R, hexaphobus_ui.STR_L]
+        for direction, command in zip(hexaphobus_ui.Direction, commands):
+            self.assertEqual(direction.name, command)
+        self.assertEqual(len(hexaphobus_ui.DIRECTIONS),
+                         len(hexaphobus_ui.Direction))
+
 if __name__ == '__main__':
     unittest.main()